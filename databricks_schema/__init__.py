@@ -10,6 +10,8 @@ from databricks_schema.diff import (
     diff_catalogs,
     diff_schema_dirs,
     diff_schemas,
+    list_schema_files,
+    load_schema_files,
 )
 from databricks_schema.extractor import CatalogExtractor
 from databricks_schema.models import Catalog, Column, ForeignKey, PrimaryKey, Schema, Table
@@ -23,7 +25,9 @@ from databricks_schema.yaml_io import (
     schema_from_json,
     schema_from_yaml,
     schema_to_json,
+    schema_to_json_bytes,
     schema_to_yaml,
+    schema_to_yaml_bytes,
 )
 
 __all__ = [
@@ -50,10 +54,14 @@ __all__ = [
     "diff_catalogs",
     "diff_schema_dirs",
     "diff_schemas",
+    "list_schema_files",
+    "load_schema_files",
     "schema_diff_to_sql",
     "schema_from_json",
     "schema_from_yaml",
     "schema_to_json",
+    "schema_to_json_bytes",
     "schema_to_yaml",
+    "schema_to_yaml_bytes",
     "validate_schemas",
 ]
@@ -16,6 +16,8 @@ from databricks_schema.diff import (
     diff_catalogs,
     diff_schema_dirs,
     diff_schemas,
+    list_schema_files,
+    load_schema_files,
 )
 from databricks_schema.extractor import CatalogExtractor
 from databricks_schema.models import Schema
@@ -26,8 +28,8 @@ from databricks_schema.yaml_io import (
     catalog_to_yaml,
     schema_from_json,
     schema_from_yaml,
-    schema_to_json,
-    schema_to_yaml,
+    schema_to_json_bytes,
+    schema_to_yaml_bytes,
 )
 
 
@@ -49,6 +51,11 @@ _package_logger.propagate = False
 
 logger = logging.getLogger(__name__)
 
+# Live-only schemas that generate-sql never proposes to drop.
+_IGNORED_ADDED: frozenset[str] = frozenset({"default"})
+
+_MARKERS: dict[str, str] = {"added": "+", "removed": "-", "modified": "~"}
+
 
 def _make_client(host: str | None, token: str | None) -> WorkspaceClient:
     kwargs = {}
@@ -111,7 +118,7 @@ def _cmd_extract(args: argparse.Namespace) -> None:
     client = _make_client(args.host, args.token)
     extractor = CatalogExtractor(client=client, max_workers=args.workers)
 
-    serializer = schema_to_json if args.fmt == "json" else schema_to_yaml
+    serializer = schema_to_json_bytes if args.fmt == "json" else schema_to_yaml_bytes
     catalog_serializer = catalog_to_json if args.fmt == "json" else catalog_to_yaml
     ext = ".json" if args.fmt == "json" else ".yaml"
 
@@ -131,6 +138,7 @@ def _cmd_extract(args: argparse.Namespace) -> None:
     output_dir: Path = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
     count = 0
+
     for s in extractor.iter_schemas(
         catalog_name=catalog_name,
         schema_filter=schema_filter,
@@ -139,7 +147,7 @@ def _cmd_extract(args: argparse.Namespace) -> None:
         include_tags=args.include_tags,
     ):
         out_file = output_dir / f"{s.name}{ext}"
-        out_file.write_text(serializer(s), encoding="utf-8")
+        out_file.write_bytes(serializer(s))
         logger.info("  Wrote %s", out_file)
         count += 1
 
@@ -149,7 +157,7 @@ def _cmd_extract(args: argparse.Namespace) -> None:
 def _cmd_diff(args: argparse.Namespace) -> None:
     """Compare Unity Catalog schemas against local YAML/JSON files, or against another catalog."""
     target: Path = args.target
-    schema_names = frozenset(args.schema) if args.schema else None
+    schema_names: frozenset[str] | None = frozenset(args.schema) if args.schema else None
 
     client = _make_client(args.host, args.token)
     extractor = CatalogExtractor(client=client, max_workers=args.workers)
@@ -158,7 +166,10 @@ def _cmd_diff(args: argparse.Namespace) -> None:
     # trip to Databricks to see whether `target` names a catalog. Anything that isn't a directory
     # is assumed to be a catalog name; if it doesn't exist, extract_catalog raises NotFound below.
     if target.is_dir():
-        fmt = _detect_fmt(target)
+        fmt, files = _scan_schema_dir(target)
+        schema_files = [f for f in files if schema_names is None or f.stem in schema_names]
+        # Parse the local files before extracting, so a malformed file fails fast.
+        stored_schemas = load_schema_files(schema_files, fmt)
         logger.info("Comparing catalog '%s' against %s...", args.catalog, target)
         catalog_obj = extractor.extract_catalog(
             catalog_name=args.catalog,
@@ -172,6 +183,7 @@ def _cmd_diff(args: argparse.Namespace) -> None:
             schema_names=schema_names,
             fmt=fmt,
             include_metadata=args.include_metadata,
+            stored_schemas=stored_schemas,
         )
     else:
         target_catalog = str(target)
@@ -204,49 +216,39 @@ def _cmd_diff(args: argparse.Namespace) -> None:
 
 
 def _print_diff(result: CatalogDiff) -> None:
-    markers = {"added": "+", "removed": "-", "modified": "~"}
+    # Buffer the whole report and write it once — large diffs can run to thousands of lines.
+    buf: list[str] = []
+    append = buf.append
+    marker = _MARKERS.get
     for s in result.schemas:
         if not s.has_changes:
             continue
-        print(f"{markers.get(s.status, '~')} Schema: {s.name} [{s.status.upper()}]")
+        append(f"{marker(s.status, '~')} Schema: {s.name} [{s.status.upper()}]\n")
         for fc in s.changes:
-            print(f"    {fc.field}: {fc.old!r} -> {fc.new!r}")
+            append(f"    {fc.field}: {fc.old!r} -> {fc.new!r}\n")
         for t in s.tables:
-            print(f"  {markers.get(t.status, '~')} Table: {t.name} [{t.status.upper()}]")
+            append(f"  {marker(t.status, '~')} Table: {t.name} [{t.status.upper()}]\n")
             for fc in t.changes:
-                print(f"      {fc.field}: {fc.old!r} -> {fc.new!r}")
+                append(f"      {fc.field}: {fc.old!r} -> {fc.new!r}\n")
             for c in t.columns:
-                print(f"    {markers.get(c.status, '~')} Column: {c.name} [{c.status.upper()}]")
+                append(f"    {marker(c.status, '~')} Column: {c.name} [{c.status.upper()}]\n")
                 for fc in c.changes:
-                    print(f"        {fc.field}: {fc.old!r} -> {fc.new!r}")
+                    append(f"        {fc.field}: {fc.old!r} -> {fc.new!r}\n")
+    sys.stdout.write("".join(buf))
 
 
 def _cmd_generate_sql(args: argparse.Namespace) -> None:
     """Generate SQL statements to bring the live catalog in line with local files."""
+    schema_names: frozenset[str] | None = frozenset(args.schema) if args.schema else None
     schema_dir: Path = args.schema_dir
     if not schema_dir.is_dir():
         print(f"Error: {schema_dir} is not a directory.", file=sys.stderr)
         sys.exit(2)
 
-    yaml_files = list(schema_dir.glob("*.yaml"))
-    json_files = list(schema_dir.glob("*.json"))
-    if yaml_files and json_files:
-        print("Error: mixed YAML and JSON files in schema directory.", file=sys.stderr)
-        sys.exit(2)
-    elif not yaml_files and not json_files:
-        print(f"No YAML or JSON files found in {schema_dir}.", file=sys.stderr)
-        sys.exit(2)
-    fmt = "json" if json_files else "yaml"
-    ext = ".json" if fmt == "json" else ".yaml"
-    loader = schema_from_json if fmt == "json" else schema_from_yaml
+    fmt, files = _scan_schema_dir(schema_dir)
 
-    schema_filter_set: frozenset[str] | None = frozenset(args.schema) if args.schema else None
-    stored: dict[str, Schema] = {}
-    for schema_file in sorted(schema_dir.glob(f"*{ext}")):
-        if schema_filter_set is not None and schema_file.stem not in schema_filter_set:
-            continue
-        schema = loader(schema_file.read_text(encoding="utf-8"))
-        stored[schema.name] = schema
+    schema_files = [f for f in files if schema_names is None or f.stem in schema_names]
+    stored: dict[str, Schema] = load_schema_files(schema_files, fmt)
 
     client = _make_client(args.host, args.token)
     extractor = CatalogExtractor(client=client, max_workers=args.workers)
@@ -259,7 +261,6 @@ def _cmd_generate_sql(args: argparse.Namespace) -> None:
     )
 
     live = {s.name: s for s in catalog_obj.schemas}
-    ignore_added: frozenset[str] = frozenset({"default"})
     sql_outputs: list[tuple[str, str]] = []
 
     for name, stored_schema in stored.items():
@@ -276,7 +277,7 @@ def _cmd_generate_sql(args: argparse.Namespace) -> None:
             sql_outputs.append((name, sql))
 
     for name in live:
-        if name not in stored and name not in ignore_added:
+        if name not in stored and name not in _IGNORED_ADDED:
             sd = SchemaDiff(name=name, status="added")
             sql = schema_diff_to_sql(args.catalog, sd, None, args.allow_drop)
             if sql:
@@ -294,42 +295,42 @@ def _cmd_generate_sql(args: argparse.Namespace) -> None:
             out_file.write_text(sql, encoding="utf-8")
             logger.info("  Wrote %s", out_file)
     else:
-        for schema_name, sql in sql_outputs:
-            print(f"-- Schema: {schema_name}")
-            print(sql)
-            print()
+        sys.stdout.write(
+            "".join(f"-- Schema: {schema_name}\n{sql}\n\n" for schema_name, sql in sql_outputs)
+        )
+
 
+def _scan_schema_dir(schema_dir: Path) -> tuple[str, list[Path]]:
+    """Return the format and sorted schema files of a directory. Exits 2 on mixed or empty.
 
-def _detect_fmt(schema_dir: Path) -> str:
-    """Auto-detect YAML or JSON format from files in a directory. Exits 2 on mixed or empty."""
-    yaml_files = list(schema_dir.glob("*.yaml"))
-    json_files = list(schema_dir.glob("*.json"))
+    Callers pass the returned files on rather than listing the directory again.
+    """
+    yaml_files, json_files = list_schema_files(schema_dir)
     if yaml_files and json_files:
         print(f"Error: mixed YAML and JSON files in {schema_dir}.", file=sys.stderr)
         sys.exit(2)
     elif not yaml_files and not json_files:
         print(f"No YAML or JSON files found in {schema_dir}.", file=sys.stderr)
         sys.exit(2)
-    return "json" if json_files else "yaml"
+    return ("json" if json_files else "yaml"), (json_files or yaml_files)
 
 
 def _cmd_validate(args: argparse.Namespace) -> None:
     """Validate local schema files for structural integrity."""
+    schema_names: frozenset[str] | None = frozenset(args.schema) if args.schema else None
     schema_dir: Path = args.schema_dir
     if not schema_dir.is_dir():
         print(f"Error: {schema_dir} is not a directory.", file=sys.stderr)
         sys.exit(2)
 
-    fmt = _detect_fmt(schema_dir)
-    ext = ".json" if fmt == "json" else ".yaml"
+    fmt, files = _scan_schema_dir(schema_dir)
     loader = schema_from_json if fmt == "json" else schema_from_yaml
 
-    schema_filter_set: frozenset[str] | None = frozenset(args.schema) if args.schema else None
     schemas: dict[str, Schema] = {}
-    for schema_file in sorted(schema_dir.glob(f"*{ext}")):
-        if schema_filter_set is not None and schema_file.stem not in schema_filter_set:
+    for schema_file in files:
+        if schema_names is not None and schema_file.stem not in schema_names:
             continue
-        schema = loader(schema_file.read_text(encoding="utf-8"))
+        schema = loader(schema_file.read_bytes())
         schemas[schema.name] = schema
 
     if not schemas:
@@ -349,6 +350,7 @@ def _cmd_validate(args: argparse.Namespace) -> None:
 
 def _cmd_diff_files(args: argparse.Namespace) -> None:
     """Compare two local directories of schema files."""
+    schema_names: frozenset[str] | None = frozenset(args.schema) if args.schema else None
     dir1: Path = args.dir1
     dir2: Path = args.dir2
     for d in (dir1, dir2):
@@ -356,17 +358,19 @@ def _cmd_diff_files(args: argparse.Namespace) -> None:
             print(f"Error: {d} is not a directory.", file=sys.stderr)
             sys.exit(2)
 
-    fmt1 = _detect_fmt(dir1)
-    fmt2 = _detect_fmt(dir2)
+    fmt1, files1 = _scan_schema_dir(dir1)
+    fmt2, files2 = _scan_schema_dir(dir2)
+    if schema_names is not None:
+        files1 = [f for f in files1 if f.stem in schema_names]
+        files2 = [f for f in files2 if f.stem in schema_names]
 
     logger.info("Comparing %s against %s...", dir1, dir2)
     result = diff_schema_dirs(
         dir1,
         dir2,
-        fmt1=fmt1,
-        fmt2=fmt2,
-        schema_names=frozenset(args.schema) if args.schema else None,
         include_metadata=args.include_metadata,
+        stored_schemas=load_schema_files(files1, fmt1),
+        live_schemas=load_schema_files(files2, fmt2),
     )
 
     if not result.has_changes:
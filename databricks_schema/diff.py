@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Literal
 
@@ -51,11 +53,30 @@ class CatalogDiff:
         return any(s.has_changes for s in self.schemas)
 
 
-def _compare_fields(stored: Any, live: Any, field_names: list[str]) -> list[FieldChange]:
+# Compared fields per entity, in report order, with a matching attrgetter that fetches them all
+# in one C call. The *_META variants add owner for include_metadata.
+_COLUMN_FIELDS = ("data_type", "comment", "nullable", "tags")
+_TABLE_FIELDS = ("table_type", "comment", "primary_key", "foreign_keys", "tags")
+_TABLE_FIELDS_META = ("table_type", "comment", "owner", "primary_key", "foreign_keys", "tags")
+_SCHEMA_FIELDS = ("comment", "tags")
+_SCHEMA_FIELDS_META = ("comment", "owner", "tags")
+
+_COLUMN_GETTER = attrgetter(*_COLUMN_FIELDS)
+_TABLE_GETTER = attrgetter(*_TABLE_FIELDS)
+_TABLE_GETTER_META = attrgetter(*_TABLE_FIELDS_META)
+_SCHEMA_GETTER = attrgetter(*_SCHEMA_FIELDS)
+_SCHEMA_GETTER_META = attrgetter(*_SCHEMA_FIELDS_META)
+
+
+def _compare_fields(
+    stored: Any, live: Any, field_names: tuple[str, ...], getter: attrgetter
+) -> list[FieldChange]:
+    old_values = getter(stored)
+    new_values = getter(live)
+    if old_values == new_values:
+        return []
     changes = []
-    for name in field_names:
-        old = getattr(stored, name, None)
-        new = getattr(live, name, None)
+    for name, old, new in zip(field_names, old_values, new_values, strict=True):
         if old != new:
             changes.append(FieldChange(field=name, old=old, new=new))
     return changes
@@ -71,12 +92,11 @@ def _diff_columns(live_cols: list[Column], stored_cols: list[Column]) -> list[Co
             diffs.append(ColumnDiff(name=name, status="removed"))
 
     for name, live_col in live_map.items():
-        if name not in stored_map:
+        stored_col = stored_map.get(name)
+        if stored_col is None:
             diffs.append(ColumnDiff(name=name, status="added"))
         else:
-            changes = _compare_fields(
-                stored_map[name], live_col, ["data_type", "comment", "nullable", "tags"]
-            )
+            changes = _compare_fields(stored_col, live_col, _COLUMN_FIELDS, _COLUMN_GETTER)
             if changes:
                 diffs.append(ColumnDiff(name=name, status="modified", changes=changes))
 
@@ -94,16 +114,17 @@ def _diff_tables(
         if name not in live_map:
             diffs.append(TableDiff(name=name, status="removed"))
 
-    table_fields = ["table_type", "comment", "primary_key", "foreign_keys", "tags"]
     if include_metadata:
-        table_fields.insert(2, "owner")
+        table_fields, table_getter = _TABLE_FIELDS_META, _TABLE_GETTER_META
+    else:
+        table_fields, table_getter = _TABLE_FIELDS, _TABLE_GETTER
 
     for name, live_table in live_map.items():
-        if name not in stored_map:
+        stored_table = stored_map.get(name)
+        if stored_table is None:
             diffs.append(TableDiff(name=name, status="added"))
         else:
-            stored_table = stored_map[name]
-            changes = _compare_fields(stored_table, live_table, table_fields)
+            changes = _compare_fields(stored_table, live_table, table_fields, table_getter)
             col_diffs = _diff_columns(live_table.columns, stored_table.columns)
             if changes or col_diffs:
                 diffs.append(
@@ -119,15 +140,58 @@ def diff_schemas(live: Schema, stored: Schema, include_metadata: bool = False) -
     Returns a SchemaDiff describing what changed between the stored YAML state
     and the live catalog state.
     """
-    schema_fields = ["comment", "tags"]
     if include_metadata:
-        schema_fields.insert(1, "owner")
-    changes = _compare_fields(stored, live, schema_fields)
+        changes = _compare_fields(stored, live, _SCHEMA_FIELDS_META, _SCHEMA_GETTER_META)
+    else:
+        changes = _compare_fields(stored, live, _SCHEMA_FIELDS, _SCHEMA_GETTER)
     table_diffs = _diff_tables(live.tables, stored.tables, include_metadata)
     status = "modified" if (changes or table_diffs) else "unchanged"
     return SchemaDiff(name=live.name, status=status, changes=changes, tables=table_diffs)
 
 
+def list_schema_files(schema_dir: Path) -> tuple[list[Path], list[Path]]:
+    """List the YAML and JSON schema files in schema_dir, each sorted, in one scandir pass.
+
+    Only entries with a matching suffix are stat'ed.
+    """
+    yaml_files: list[Path] = []
+    json_files: list[Path] = []
+    with os.scandir(schema_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".yaml"):
+                files = yaml_files
+            elif name.endswith(".json"):
+                files = json_files
+            else:
+                continue
+            if entry.is_file():
+                files.append(Path(entry.path))
+    yaml_files.sort()
+    json_files.sort()
+    return yaml_files, json_files
+
+
+def _load_schema_dir(
+    schema_dir: Path,
+    fmt: Literal["yaml", "json"],
+    schema_names: frozenset[str] | None,
+) -> dict[str, Schema]:
+    """Load schema files from schema_dir keyed by schema name, in sorted file order."""
+    yaml_files, json_files = list_schema_files(schema_dir)
+    files = json_files if fmt == "json" else yaml_files
+    if schema_names is not None:
+        files = [f for f in files if f.stem in schema_names]
+    return load_schema_files(files, fmt)
+
+
+def load_schema_files(files: list[Path], fmt: Literal["yaml", "json"]) -> dict[str, Schema]:
+    """Parse schema files of the given format, keyed by schema name in file order."""
+    loader = schema_from_json if fmt == "json" else schema_from_yaml
+    schemas = [loader(f.read_bytes()) for f in files]
+    return {s.name: s for s in schemas}
+
+
 def diff_schema_dirs(
     dir1: Path,
     dir2: Path,
@@ -135,6 +199,8 @@ def diff_schema_dirs(
     fmt2: Literal["yaml", "json"] = "yaml",
     schema_names: frozenset[str] | None = None,
     include_metadata: bool = False,
+    stored_schemas: dict[str, Schema] | None = None,
+    live_schemas: dict[str, Schema] | None = None,
 ) -> CatalogDiff:
     """Compare two local directories of schema files.
 
@@ -147,21 +213,19 @@ def diff_schema_dirs(
 
     schema_names: if set, only files whose stem is in this set are loaded from either directory.
     fmt1 / fmt2: file format for dir1 and dir2 respectively ("yaml" or "json").
+    stored_schemas / live_schemas: already-loaded schemas keyed by name for dir1 / dir2; when
+                    given, that directory is not read and schema_names is not applied to them.
+                    Pass the files from list_schema_files through load_schema_files to list
+                    each directory only once.
     """
-
-    def _load_dir(path: Path, fmt: Literal["yaml", "json"]) -> dict[str, Schema]:
-        ext = ".json" if fmt == "json" else ".yaml"
-        loader = schema_from_json if fmt == "json" else schema_from_yaml
-        schemas: dict[str, Schema] = {}
-        for f in sorted(path.glob(f"*{ext}")):
-            if schema_names is not None and f.stem not in schema_names:
-                continue
-            schema = loader(f.read_text(encoding="utf-8"))
-            schemas[schema.name] = schema
-        return schemas
-
-    stored = _load_dir(dir1, fmt1)
-    live = _load_dir(dir2, fmt2)
+    if stored_schemas is None:
+        stored = _load_schema_dir(dir1, fmt1, schema_names)
+    else:
+        stored = stored_schemas
+    if live_schemas is None:
+        live = _load_schema_dir(dir2, fmt2, schema_names)
+    else:
+        live = live_schemas
 
     schema_diffs: list[SchemaDiff] = []
     for name, stored_schema in stored.items():
@@ -220,6 +284,7 @@ def diff_catalog_with_dir(
     schema_names: frozenset[str] | None = None,
     fmt: Literal["yaml", "json"] = "yaml",
     include_metadata: bool = False,
+    stored_schemas: dict[str, Schema] | None = None,
 ) -> CatalogDiff:
     """Compare a Catalog against schema files in schema_dir.
 
@@ -234,15 +299,14 @@ def diff_catalog_with_dir(
                   Use this when comparing a subset of schemas to avoid reporting
                   unrelated schemas as removed.
     fmt: file format to read ("yaml" or "json").
+    stored_schemas: already-loaded schemas keyed by name; when given, schema_dir is not read
+                    and schema_names is not applied to them — select the files by stem
+                    before loading, as the directory path does.
     """
-    ext = ".json" if fmt == "json" else ".yaml"
-    loader = schema_from_json if fmt == "json" else schema_from_yaml
-    stored: dict[str, Schema] = {}
-    for schema_file in sorted(schema_dir.glob(f"*{ext}")):
-        if schema_names is not None and schema_file.stem not in schema_names:
-            continue
-        schema = loader(schema_file.read_text(encoding="utf-8"))
-        stored[schema.name] = schema
+    if stored_schemas is None:
+        stored = _load_schema_dir(schema_dir, fmt, schema_names)
+    else:
+        stored = stored_schemas
 
     live = {s.name: s for s in catalog.schemas}
     schema_diffs: list[SchemaDiff] = []
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
@@ -12,7 +12,11 @@ from databricks_schema.models import Catalog, Column, ForeignKey, PrimaryKey, Sc
 
 logger = logging.getLogger(__name__)
 
-_SYSTEM_SCHEMAS = {"information_schema"}
+_SYSTEM_SCHEMAS: frozenset[str] = frozenset({"information_schema"})
+
+
+def _column_position(sdk_col) -> int:
+    return sdk_col.position or 9999
 
 
 class CatalogExtractor:
@@ -38,28 +42,31 @@ class CatalogExtractor:
     def iter_schemas(
         self,
         catalog_name: str,
-        schema_filter: list[str] | None = None,
+        schema_filter: Collection[str] | None = None,
         include_metadata: bool = False,
         include_tags: bool = False,
-        table_filter: list[str] | None = None,
+        table_filter: Collection[str] | None = None,
     ) -> Iterator[Schema]:
+        # Filters may be any collection; hash them once rather than scanning a list per name.
+        schema_names = frozenset(schema_filter) if schema_filter else None
+        table_names = frozenset(table_filter) if table_filter else None
         for sdk_schema in self.client.schemas.list(catalog_name=catalog_name):
             schema_name = sdk_schema.name or ""
             if schema_name in _SYSTEM_SCHEMAS:
                 continue
-            if schema_filter and schema_name not in schema_filter:
+            if schema_names is not None and schema_name not in schema_names:
                 continue
             yield self._extract_schema(
-                catalog_name, sdk_schema, include_metadata, include_tags, table_filter
+                catalog_name, sdk_schema, include_metadata, include_tags, table_names
             )
 
     def extract_catalog(
         self,
         catalog_name: str,
-        schema_filter: list[str] | None = None,
+        schema_filter: Collection[str] | None = None,
         include_metadata: bool = False,
         include_tags: bool = False,
-        table_filter: list[str] | None = None,
+        table_filter: Collection[str] | None = None,
     ) -> Catalog:
         sdk_catalog = self.client.catalogs.get(catalog_name)
         catalog_tags = self._fetch_tags("catalogs", catalog_name) if include_tags else {}
@@ -87,7 +94,7 @@ class CatalogExtractor:
         sdk_schema,
         include_metadata: bool = False,
         include_tags: bool = False,
-        table_filter: list[str] | None = None,
+        table_filter: Collection[str] | None = None,
     ) -> Schema:
         schema_name = sdk_schema.name or ""
         schema_tags = (
@@ -132,15 +139,16 @@ class CatalogExtractor:
         full_name = f"{catalog_name}.{schema_name}.{table_name}"
         table_tags = self._fetch_tags("tables", full_name) if include_tags else {}
 
-        # Build columns sorted by position
-        sdk_columns = list(getattr(sdk_table, "columns", None) or [])
-        sdk_columns.sort(key=lambda c: getattr(c, "position", None) or 9999)
+        # Build columns sorted by position. SDK ColumnInfo is a dataclass, so its fields are read
+        # directly rather than through getattr with defaults.
+        sdk_columns = sorted(sdk_table.columns or [], key=_column_position)
 
         columns: list[Column] = []
         for sdk_col in sdk_columns:
+            col_name = sdk_col.name or ""
             # Prefer type_text (e.g. "ARRAY<STRING>"), fall back to type_name
-            type_text = getattr(sdk_col, "type_text", None)
-            type_name = getattr(sdk_col, "type_name", None)
+            type_text = sdk_col.type_text
+            type_name = sdk_col.type_name
             if type_text:
                 data_type = type_text
             elif type_name is not None:
@@ -148,21 +156,16 @@ class CatalogExtractor:
             else:
                 data_type = "UNKNOWN"
 
+            nullable = sdk_col.nullable
             col_tags = (
-                self._fetch_tags("columns", f"{full_name}.{sdk_col.name or ''}")
-                if include_tags
-                else {}
+                self._fetch_tags("columns", f"{full_name}.{col_name}") if include_tags else {}
             )
             columns.append(
                 Column(
-                    name=sdk_col.name or "",
+                    name=col_name,
                     data_type=data_type,
-                    comment=getattr(sdk_col, "comment", None),
-                    nullable=(
-                        getattr(sdk_col, "nullable", True)
-                        if getattr(sdk_col, "nullable", None) is not None
-                        else True
-                    ),
+                    comment=sdk_col.comment,
+                    nullable=nullable if nullable is not None else True,
                     tags=col_tags,
                 )
             )
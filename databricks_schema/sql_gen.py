@@ -18,8 +18,13 @@ def _schema_ref(catalog: str, schema: str) -> str:
     return f"{_q(catalog)}.{_q(schema)}"
 
 
+def _table_ref_in(sref: str, table: str) -> str:
+    """Table reference under an already-quoted schema reference."""
+    return f"{sref}.{_q(table)}"
+
+
 def _table_ref(catalog: str, schema: str, table: str) -> str:
-    return f"{_q(catalog)}.{_q(schema)}.{_q(table)}"
+    return _table_ref_in(_schema_ref(catalog, schema), table)
 
 
 def _column_def(col: Column) -> str:
@@ -114,9 +119,8 @@ def _fk_stmts(
     return stmts
 
 
-def _create_table(catalog: str, schema: str, table: Table) -> str:
+def _create_table(tref: str, table: Table) -> str:
     """Generate a CREATE TABLE IF NOT EXISTS statement with column definitions."""
-    tref = _table_ref(catalog, schema, table.name)
     col_defs = ", ".join(_column_def(col) for col in table.columns)
     stmt = f"CREATE TABLE IF NOT EXISTS {tref} ({col_defs})"
     if table.comment:
@@ -148,48 +152,41 @@ def _col_diff_stmts(
             stmts.append(f"-- {drop_stmt}")
 
     elif col_diff.status == "modified":
+        alter = f"ALTER TABLE {tref} ALTER COLUMN {col_name}"
         for fc in col_diff.changes:
             if fc.field == "data_type":
-                stmts.append(f"ALTER TABLE {tref} ALTER COLUMN {col_name} TYPE {fc.old};")
+                stmts.append(f"{alter} TYPE {fc.old};")
             elif fc.field == "comment":
                 if fc.old is not None:
-                    stmts.append(
-                        f"ALTER TABLE {tref} ALTER COLUMN {col_name} COMMENT '{_esc(str(fc.old))}';"
-                    )
+                    stmts.append(f"{alter} COMMENT '{_esc(str(fc.old))}';")
                 else:
-                    stmts.append(f"ALTER TABLE {tref} ALTER COLUMN {col_name} COMMENT NULL;")
+                    stmts.append(f"{alter} COMMENT NULL;")
             elif fc.field == "nullable":
                 if fc.old is False:
-                    stmts.append(f"ALTER TABLE {tref} ALTER COLUMN {col_name} SET NOT NULL;")
+                    stmts.append(f"{alter} SET NOT NULL;")
                 else:
-                    stmts.append(f"ALTER TABLE {tref} ALTER COLUMN {col_name} DROP NOT NULL;")
+                    stmts.append(f"{alter} DROP NOT NULL;")
             elif fc.field == "tags":
-                stmts.extend(
-                    _tag_stmts(
-                        f"ALTER TABLE {tref} ALTER COLUMN {col_name}",
-                        fc.old or {},
-                        fc.new or {},
-                    )
-                )
+                stmts.extend(_tag_stmts(alter, fc.old or {}, fc.new or {}))
 
     return stmts
 
 
 def _table_diff_stmts(
     catalog: str,
-    schema: str,
+    sref: str,
     table_diff: TableDiff,
     stored_table_map: dict[str, Table],
     allow_drop: bool,
 ) -> list[str]:
     """Generate SQL statements for a single table diff."""
     stmts: list[str] = []
-    tref = _table_ref(catalog, schema, table_diff.name)
+    tref = _table_ref_in(sref, table_diff.name)
 
     if table_diff.status == "removed":
         stored_table = stored_table_map.get(table_diff.name)
         if stored_table:
-            stmts.append(_create_table(catalog, schema, stored_table))
+            stmts.append(_create_table(tref, stored_table))
             if stored_table.owner:
                 stmts.append(f"ALTER TABLE {tref} SET OWNER TO {_q(stored_table.owner)};")
             if stored_table.tags:
@@ -266,8 +263,8 @@ def schema_diff_to_sql(
             if stored_schema.tags:
                 stmts.append(f"ALTER SCHEMA {sref} SET TAGS {_tags_set(stored_schema.tags)};")
             for table in stored_schema.tables:
-                stmts.append(_create_table(catalog_name, schema_diff.name, table))
-                tref = _table_ref(catalog_name, schema_diff.name, table.name)
+                tref = _table_ref_in(sref, table.name)
+                stmts.append(_create_table(tref, table))
                 if table.owner:
                     stmts.append(f"ALTER TABLE {tref} SET OWNER TO {_q(table.owner)};")
                 if table.tags:
@@ -300,9 +297,7 @@ def schema_diff_to_sql(
 
         for table_diff in schema_diff.tables:
             stmts.extend(
-                _table_diff_stmts(
-                    catalog_name, schema_diff.name, table_diff, stored_table_map, allow_drop
-                )
+                _table_diff_stmts(catalog_name, sref, table_diff, stored_table_map, allow_drop)
             )
 
     return "\n".join(stmts)
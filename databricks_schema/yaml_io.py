@@ -1,48 +1,70 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import orjson
 import yaml
 
 from databricks_schema.models import Catalog, Schema
 
+# Prefer the libyaml C bindings; fall back to the pure-Python classes when PyYAML
+# was built without libyaml.
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
 
 def _strip_empty(obj: Any) -> Any:
     """Recursively remove None values and empty dicts/lists.
 
     Preserves False, 0, and empty strings as intentional values.
     """
+    # Only containers are recursed into; scalars are handled inline to save a call per leaf.
     if isinstance(obj, dict):
         result = {}
         for k, v in obj.items():
-            stripped = _strip_empty(v)
-            if stripped is None:
-                continue
-            if isinstance(stripped, (dict, list)) and len(stripped) == 0:
+            if isinstance(v, (dict, list)):
+                v = _strip_empty(v)
+                if not v:
+                    continue
+            elif v is None:
                 continue
-            result[k] = stripped
+            result[k] = v
         return result
     if isinstance(obj, list):
-        return [_strip_empty(item) for item in obj]
+        return [_strip_empty(item) if isinstance(item, (dict, list)) else item for item in obj]
     return obj
 
 
+_YAML_DUMP_OPTIONS: dict[str, Any] = {
+    "default_flow_style": False,
+    "sort_keys": False,
+    "allow_unicode": True,
+}
+
+
 def _to_yaml(data: dict) -> str:
-    return yaml.dump(
-        _strip_empty(data),
-        default_flow_style=False,
-        sort_keys=False,
-        allow_unicode=True,
-    )
+    return yaml.dump(_strip_empty(data), Dumper=_Dumper, **_YAML_DUMP_OPTIONS)
+
+
+def _to_yaml_bytes(data: dict) -> bytes:
+    return yaml.dump(_strip_empty(data), Dumper=_Dumper, encoding="utf-8", **_YAML_DUMP_OPTIONS)
 
 
 def schema_to_yaml(schema: Schema) -> str:
     return _to_yaml(schema.model_dump(mode="json"))
 
 
-def schema_from_yaml(text: str) -> Schema:
-    data = yaml.safe_load(text)
+def schema_to_yaml_bytes(schema: Schema) -> bytes:
+    """Like schema_to_yaml, but UTF-8 encoded — for writing straight to a file."""
+    return _to_yaml_bytes(schema.model_dump(mode="json"))
+
+
+def schema_from_yaml(text: str | bytes) -> Schema:
+    data = yaml.load(text, Loader=_Loader)
     return Schema.model_validate(data)
 
 
@@ -50,26 +72,36 @@ def catalog_to_yaml(catalog: Catalog) -> str:
     return _to_yaml(catalog.model_dump(mode="json"))
 
 
-def catalog_from_yaml(text: str) -> Catalog:
-    data = yaml.safe_load(text)
+def catalog_from_yaml(text: str | bytes) -> Catalog:
+    data = yaml.load(text, Loader=_Loader)
     return Catalog.model_validate(data)
 
 
+def _to_json_bytes(data: dict) -> bytes:
+    # OPT_INDENT_2 produces the same text as json.dumps(indent=2, ensure_ascii=False)
+    return orjson.dumps(_strip_empty(data), option=orjson.OPT_INDENT_2)
+
+
 def _to_json(data: dict) -> str:
-    return json.dumps(_strip_empty(data), indent=2, ensure_ascii=False)
+    return _to_json_bytes(data).decode()
 
 
 def schema_to_json(schema: Schema) -> str:
     return _to_json(schema.model_dump(mode="json"))
 
 
-def schema_from_json(text: str) -> Schema:
-    return Schema.model_validate(json.loads(text))
+def schema_to_json_bytes(schema: Schema) -> bytes:
+    """Like schema_to_json, but UTF-8 encoded — for writing straight to a file."""
+    return _to_json_bytes(schema.model_dump(mode="json"))
+
+
+def schema_from_json(text: str | bytes) -> Schema:
+    return Schema.model_validate(orjson.loads(text))
 
 
 def catalog_to_json(catalog: Catalog) -> str:
     return _to_json(catalog.model_dump(mode="json"))
 
 
-def catalog_from_json(text: str) -> Catalog:
-    return Catalog.model_validate(json.loads(text))
+def catalog_from_json(text: str | bytes) -> Catalog:
+    return Catalog.model_validate(orjson.loads(text))
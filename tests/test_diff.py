@@ -2,11 +2,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from databricks_schema.diff import (
+    CatalogDiff,
+    SchemaDiff,
     diff_catalog_with_dir,
     diff_catalogs,
     diff_schema_dirs,
     diff_schemas,
+    list_schema_files,
+    load_schema_files,
 )
 from databricks_schema.models import Catalog, Column, ForeignKey, PrimaryKey, Schema, Table
 from databricks_schema.yaml_io import schema_to_json, schema_to_yaml
@@ -33,6 +39,15 @@ def _col(name, data_type="STRING", comment=None, nullable=True, tags=None):
     )
 
 
+def _by_name(items):
+    return {x.name: x for x in items}
+
+
+# Serialised bare schemas, shared by the directory tests that only need a file to exist.
+_MAIN_YAML = schema_to_yaml(_schema("main"))
+_RAW_YAML = schema_to_yaml(_schema("raw"))
+
+
 class TestDiffSchemas:
     def test_no_changes(self):
         schema = _schema(tables=[_table("users", columns=[_col("id")])])
@@ -42,24 +57,23 @@ class TestDiffSchemas:
         assert result.changes == []
         assert result.tables == []
 
-    def test_comment_changed(self):
-        stored = _schema(comment="old comment")
-        live = _schema(comment="new comment")
-        result = diff_schemas(live=live, stored=stored)
+    @pytest.mark.parametrize(
+        ("field", "old", "new", "include_metadata"),
+        [
+            ("comment", "old comment", "new comment", False),
+            ("owner", "alice", "bob", True),
+            ("tags", {"env": "prod"}, {"env": "staging"}, False),
+        ],
+    )
+    def test_schema_field_changed(self, field, old, new, include_metadata):
+        stored = _schema(**{field: old})
+        live = _schema(**{field: new})
+        result = diff_schemas(live=live, stored=stored, include_metadata=include_metadata)
         assert result.status == "modified"
         assert len(result.changes) == 1
-        assert result.changes[0].field == "comment"
-        assert result.changes[0].old == "old comment"
-        assert result.changes[0].new == "new comment"
-
-    def test_owner_changed(self):
-        stored = _schema(owner="alice")
-        live = _schema(owner="bob")
-        result = diff_schemas(live=live, stored=stored, include_metadata=True)
-        assert result.status == "modified"
-        assert result.changes[0].field == "owner"
-        assert result.changes[0].old == "alice"
-        assert result.changes[0].new == "bob"
+        assert result.changes[0].field == field
+        assert result.changes[0].old == old
+        assert result.changes[0].new == new
 
     def test_owner_ignored_without_metadata(self):
         stored = _schema(owner="alice")
@@ -67,13 +81,6 @@ class TestDiffSchemas:
         result = diff_schemas(live=live, stored=stored)
         assert result.status == "unchanged"
 
-    def test_tags_changed(self):
-        stored = _schema(tags={"env": "prod"})
-        live = _schema(tags={"env": "staging"})
-        result = diff_schemas(live=live, stored=stored)
-        assert result.status == "modified"
-        assert result.changes[0].field == "tags"
-
     def test_table_added(self):
         stored = _schema(tables=[])
         live = _schema(tables=[_table("users")])
@@ -108,33 +115,32 @@ class TestDiffSchemas:
         result = diff_schemas(live=live, stored=stored)
         t = result.tables[0]
         assert t.status == "modified"
-        col_diff = next(c for c in t.columns if c.name == "email")
+        col_diff = _by_name(t.columns)["email"]
         assert col_diff.status == "added"
 
     def test_column_removed(self):
         stored = _schema(tables=[_table("users", columns=[_col("id"), _col("email")])])
         live = _schema(tables=[_table("users", columns=[_col("id")])])
         result = diff_schemas(live=live, stored=stored)
-        col_diff = next(c for c in result.tables[0].columns if c.name == "email")
+        col_diff = _by_name(result.tables[0].columns)["email"]
         assert col_diff.status == "removed"
 
-    def test_column_type_changed(self):
-        stored = _schema(tables=[_table("t", columns=[_col("x", data_type="STRING")])])
-        live = _schema(tables=[_table("t", columns=[_col("x", data_type="BIGINT")])])
-        result = diff_schemas(live=live, stored=stored)
-        col_diff = result.tables[0].columns[0]
-        assert col_diff.status == "modified"
-        assert col_diff.changes[0].field == "data_type"
-        assert col_diff.changes[0].old == "STRING"
-        assert col_diff.changes[0].new == "BIGINT"
-
-    def test_column_nullable_changed(self):
-        stored = _schema(tables=[_table("t", columns=[_col("id", nullable=True)])])
-        live = _schema(tables=[_table("t", columns=[_col("id", nullable=False)])])
+    @pytest.mark.parametrize(
+        ("field", "old", "new"),
+        [
+            ("data_type", "STRING", "BIGINT"),
+            ("nullable", True, False),
+        ],
+    )
+    def test_column_field_changed(self, field, old, new):
+        stored = _schema(tables=[_table("t", columns=[_col("x", **{field: old})])])
+        live = _schema(tables=[_table("t", columns=[_col("x", **{field: new})])])
         result = diff_schemas(live=live, stored=stored)
         col_diff = result.tables[0].columns[0]
         assert col_diff.status == "modified"
-        assert col_diff.changes[0].field == "nullable"
+        assert col_diff.changes[0].field == field
+        assert col_diff.changes[0].old == old
+        assert col_diff.changes[0].new == new
 
     def test_pk_changed(self):
         stored = _schema(tables=[Table(name="t", primary_key=None)])
@@ -163,19 +169,18 @@ class TestDiffCatalogWithDir:
 
     def test_schema_added_in_catalog(self, tmp_path: Path):
         stored = _schema("main")
-        (tmp_path / "main.yaml").write_text(schema_to_yaml(stored))
+        (tmp_path / "main.yaml").write_text(_MAIN_YAML)
         # catalog has main + extra schema not in YAML dir
         catalog = Catalog(name="prod", schemas=[stored, _schema("extra")])
         result = diff_catalog_with_dir(catalog, tmp_path)
-        added = next(s for s in result.schemas if s.name == "extra")
+        added = _by_name(result.schemas)["extra"]
         assert added.status == "added"
 
     def test_schema_names_filter_prevents_false_removed(self, tmp_path: Path):
         # Both main.yaml and raw.yaml exist, but we only compare main
         main = _schema("main")
-        raw = _schema("raw")
-        (tmp_path / "main.yaml").write_text(schema_to_yaml(main))
-        (tmp_path / "raw.yaml").write_text(schema_to_yaml(raw))
+        (tmp_path / "main.yaml").write_text(_MAIN_YAML)
+        (tmp_path / "raw.yaml").write_text(_RAW_YAML)
         # catalog only contains main (as if --schema main was passed)
         catalog = Catalog(name="prod", schemas=[main])
         result = diff_catalog_with_dir(catalog, tmp_path, schema_names=frozenset({"main"}))
@@ -185,7 +190,7 @@ class TestDiffCatalogWithDir:
 
     def test_default_schema_not_reported_as_added(self, tmp_path: Path):
         stored = _schema("main")
-        (tmp_path / "main.yaml").write_text(schema_to_yaml(stored))
+        (tmp_path / "main.yaml").write_text(_MAIN_YAML)
         # catalog has main + default, but no default.yaml
         catalog = Catalog(name="prod", schemas=[stored, _schema("default")])
         result = diff_catalog_with_dir(catalog, tmp_path)
@@ -194,26 +199,25 @@ class TestDiffCatalogWithDir:
 
     def test_default_schema_ignored_but_others_reported(self, tmp_path: Path):
         stored = _schema("main")
-        (tmp_path / "main.yaml").write_text(schema_to_yaml(stored))
+        (tmp_path / "main.yaml").write_text(_MAIN_YAML)
         # catalog has main + default + new_schema without YAML files
         catalog = Catalog(name="prod", schemas=[stored, _schema("default"), _schema("new_schema")])
         result = diff_catalog_with_dir(catalog, tmp_path)
         assert not any(s.name == "default" for s in result.schemas)
-        new_diff = next(s for s in result.schemas if s.name == "new_schema")
+        new_diff = _by_name(result.schemas)["new_schema"]
         assert new_diff.status == "added"
         assert result.has_changes
 
     def test_ignore_added_can_be_overridden(self, tmp_path: Path):
         stored = _schema("main")
-        (tmp_path / "main.yaml").write_text(schema_to_yaml(stored))
+        (tmp_path / "main.yaml").write_text(_MAIN_YAML)
         catalog = Catalog(name="prod", schemas=[stored, _schema("default")])
         # passing empty frozenset means default is NOT ignored
         result = diff_catalog_with_dir(catalog, tmp_path, ignore_added=frozenset())
         assert any(s.name == "default" and s.status == "added" for s in result.schemas)
 
     def test_schema_removed_from_catalog(self, tmp_path: Path):
-        stored = _schema("main")
-        (tmp_path / "main.yaml").write_text(schema_to_yaml(stored))
+        (tmp_path / "main.yaml").write_text(_MAIN_YAML)
         # catalog is empty — schema exists in YAML but not in live
         catalog = Catalog(name="prod", schemas=[])
         result = diff_catalog_with_dir(catalog, tmp_path)
@@ -228,12 +232,40 @@ class TestDiffCatalogWithDir:
         live_s2 = _schema("raw", comment="new")
         catalog = Catalog(name="prod", schemas=[s1, live_s2])
         result = diff_catalog_with_dir(catalog, tmp_path)
-        main_diff = next(s for s in result.schemas if s.name == "main")
-        raw_diff = next(s for s in result.schemas if s.name == "raw")
+        diffs = _by_name(result.schemas)
+        main_diff = diffs["main"]
+        raw_diff = diffs["raw"]
         assert main_diff.status == "unchanged"
         assert raw_diff.status == "modified"
         assert result.has_changes
 
+    def test_schemas_reported_in_file_order(self, tmp_path: Path):
+        for i in (3, 0, 5, 1, 4, 2):
+            (tmp_path / f"s{i}.yaml").write_text(schema_to_yaml(_schema(f"s{i}", comment="old")))
+        catalog = Catalog(name="prod", schemas=[_schema("s3", comment="new")])
+        result = diff_catalog_with_dir(catalog, tmp_path)
+        assert [s.name for s in result.schemas] == [f"s{i}" for i in range(6)]
+
+    def test_stored_schemas_skip_dir(self, tmp_path: Path):
+        # schema_dir is empty: the pre-loaded schemas are used instead
+        stored = {"main": _schema("main", comment="old")}
+        catalog = Catalog(name="prod", schemas=[_schema("main", comment="new")])
+        result = diff_catalog_with_dir(catalog, tmp_path, stored_schemas=stored)
+        assert [(s.name, s.status) for s in result.schemas] == [("main", "modified")]
+
+    def test_stored_schemas_not_refiltered_by_name(self, tmp_path: Path):
+        # The caller selected main.yaml by stem; its schema name differs and is still compared
+        (tmp_path / "main.yaml").write_text(schema_to_yaml(_schema("main_v2", comment="old")))
+        files = [tmp_path / "main.yaml"]
+        catalog = Catalog(name="prod", schemas=[_schema("main_v2", comment="new")])
+        result = diff_catalog_with_dir(
+            catalog,
+            tmp_path,
+            schema_names=frozenset({"main"}),
+            stored_schemas=load_schema_files(files, "yaml"),
+        )
+        assert [(s.name, s.status) for s in result.schemas] == [("main_v2", "modified")]
+
     def test_empty_dir_raises(self, tmp_path: Path):
         # diff_catalog_with_dir with no yaml files → empty CatalogDiff
         catalog = Catalog(name="prod", schemas=[])
@@ -250,6 +282,36 @@ class TestDiffCatalogWithDir:
         assert result.schemas[0].status == "unchanged"
 
 
+class TestLoadSchemaFiles:
+    def test_keyed_by_schema_name_in_file_order(self, tmp_path: Path):
+        (tmp_path / "a.json").write_text(schema_to_json(_schema("raw")))
+        (tmp_path / "b.json").write_text(schema_to_json(_schema("main", comment="c")))
+        loaded = load_schema_files([tmp_path / "a.json", tmp_path / "b.json"], "json")
+        assert list(loaded) == ["raw", "main"]
+        assert loaded["main"].comment == "c"
+
+
+class TestListSchemaFiles:
+    def test_splits_by_suffix_sorted(self, tmp_path: Path):
+        for name in ("b.yaml", "a.yaml", "c.json", "notes.txt"):
+            (tmp_path / name).write_text("")
+        (tmp_path / "dir.yaml").mkdir()
+        yaml_files, json_files = list_schema_files(tmp_path)
+        assert yaml_files == [tmp_path / "a.yaml", tmp_path / "b.yaml"]
+        assert json_files == [tmp_path / "c.json"]
+
+
+class TestHasChanges:
+    def test_reflects_later_mutation(self):
+        sd = SchemaDiff(name="main", status="unchanged")
+        cd = CatalogDiff(schemas=[sd])
+        assert not cd.has_changes
+        sd.status = "modified"
+        assert sd.has_changes
+        cd.schemas.append(SchemaDiff(name="raw", status="added"))
+        assert cd.has_changes
+
+
 class TestDiffCatalogs:
     def test_no_changes(self):
         schema = _schema("main", tables=[_table("users", columns=[_col("id")])])
@@ -264,7 +326,7 @@ class TestDiffCatalogs:
         live = Catalog(name="dev", schemas=[main, _schema("extra")])
         stored = Catalog(name="prod", schemas=[main])
         result = diff_catalogs(live, stored)
-        added = next(s for s in result.schemas if s.name == "extra")
+        added = _by_name(result.schemas)["extra"]
         assert added.status == "added"
 
     def test_schema_removed_from_live(self):
@@ -335,7 +397,7 @@ class TestDiffSchemaDirs:
         extra = _schema("extra")
         (d2 / "extra.yaml").write_text(schema_to_yaml(extra))
         result = diff_schema_dirs(d1, d2)
-        added = next(s for s in result.schemas if s.name == "extra")
+        added = _by_name(result.schemas)["extra"]
         assert added.status == "added"
 
     def test_schema_removed_from_dir2(self, tmp_path: Path):
@@ -390,3 +452,13 @@ class TestDiffSchemaDirs:
         (d2 / "raw.yaml").write_text(schema_to_yaml(raw_new))
         result = diff_schema_dirs(d1, d2, schema_names=frozenset({"main"}))
         assert not result.has_changes
+
+    def test_preloaded_schemas_skip_dirs(self, tmp_path: Path):
+        # Both directories are empty: the pre-loaded schemas are used instead
+        stored = {"main": _schema("main", comment="old"), "raw": _schema("raw")}
+        live = {"main": _schema("main", comment="new")}
+        result = diff_schema_dirs(tmp_path, tmp_path, stored_schemas=stored, live_schemas=live)
+        assert [(s.name, s.status) for s in result.schemas] == [
+            ("main", "modified"),
+            ("raw", "removed"),
+        ]
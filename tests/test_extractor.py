@@ -1,6 +1,8 @@
 import logging
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
 from databricks.sdk.errors import NotFound
 from databricks.sdk.service.catalog import TableType
 
@@ -8,98 +10,100 @@ from databricks_schema.extractor import CatalogExtractor
 
 
 def _make_col(name, position, type_text=None, type_name=None, nullable=True, comment=None):
-    col = MagicMock()
-    col.name = name
-    col.position = position
-    col.type_text = type_text
-    col.type_name = type_name
-    col.nullable = nullable
-    col.comment = comment
-    return col
+    return SimpleNamespace(
+        name=name,
+        position=position,
+        type_text=type_text,
+        type_name=type_name,
+        nullable=nullable,
+        comment=comment,
+    )
+
+
+def _make_schema(name, comment=None, owner=None):
+    return SimpleNamespace(name=name, comment=comment, owner=owner)
 
 
 def _make_tag(key, value=""):
-    t = MagicMock()
-    t.tag_key = key
-    t.tag_value = value
-    return t
+    return SimpleNamespace(tag_key=key, tag_value=value)
+
+
+def _tag_dispatcher(mapping):
+    """side_effect for entity_tag_assignments.list serving tags per (entity_type, name)."""
+
+    def list_tags(entity_type, entity_name):
+        return mapping.get((entity_type, entity_name), [])
+
+    return list_tags
 
 
 def _make_sdk_table(
     name,
-    table_type_val=None,
+    table_type=None,
     columns=None,
     constraints=None,
     comment=None,
     owner=None,
 ):
-    t = MagicMock()
-    t.name = name
-    t.comment = comment
-    t.storage_location = None
-    t.columns = columns or []
-    t.table_constraints = constraints or []
-    t.owner = owner
-    t.table_type = TableType(table_type_val) if table_type_val else None
-    return t
+    return SimpleNamespace(
+        name=name,
+        comment=comment,
+        storage_location=None,
+        columns=columns or [],
+        table_constraints=constraints or [],
+        owner=owner,
+        table_type=table_type,
+    )
 
 
 def _make_constraint(pk=None, fk=None):
-    c = MagicMock()
-    c.primary_key_constraint = pk
-    c.foreign_key_constraint = fk
-    return c
+    return SimpleNamespace(primary_key_constraint=pk, foreign_key_constraint=fk)
 
 
-class TestCatalogExtractor:
-    def _extractor(self, max_workers=1):
-        client = MagicMock()
-        return CatalogExtractor(client=client, max_workers=max_workers), client
+@pytest.fixture
+def extractor_ctx():
+    """A serial extractor over a mock client wired with an empty catalog `mycat`.
+
+    Function-scoped: tests override return values and side effects on the client.
+    """
+    client = MagicMock()
+    client.catalogs.get.return_value = SimpleNamespace(comment=None)
+    client.schemas.list.return_value = []
+    client.tables.list.return_value = []
+    client.entity_tag_assignments.list.return_value = []
+    return CatalogExtractor(client=client, max_workers=1), client
+
+
+@pytest.fixture
+def main_schema_ctx(extractor_ctx):
+    """extractor_ctx with a single schema `main`; tests only set up its tables."""
+    _, client = extractor_ctx
+    client.schemas.list.return_value = [_make_schema("main")]
+    return extractor_ctx
+
 
-    def test_empty_catalog(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-        client.schemas.list.return_value = []
+class TestCatalogExtractor:
+    def test_empty_catalog(self, extractor_ctx):
+        extractor, client = extractor_ctx
 
         catalog = extractor.extract_catalog("mycat")
         assert catalog.name == "mycat"
         assert catalog.schemas == []
         client.catalogs.get.assert_called_once_with("mycat")
 
-    def test_schema_filter(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s1 = MagicMock()
-        s1.name = "keep"
-        s1.comment = None
-        s1.owner = None
-        s2 = MagicMock()
-        s2.name = "skip"
-        s2.comment = None
-        s2.owner = None
+    def test_schema_filter(self, extractor_ctx):
+        extractor, client = extractor_ctx
+
+        s1 = _make_schema("keep")
+        s2 = _make_schema("skip")
         client.schemas.list.return_value = [s1, s2]
-        client.tables.list.return_value = []
 
         catalog = extractor.extract_catalog("mycat", schema_filter=["keep"])
         assert len(catalog.schemas) == 1
         assert catalog.schemas[0].name == "keep"
 
-    def test_table_filter(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+    def test_table_filter(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
         keep = _make_sdk_table("keep")
         skip = _make_sdk_table("skip")
@@ -110,32 +114,17 @@ class TestCatalogExtractor:
         assert len(tables) == 1
         assert tables[0].name == "keep"
 
-    def test_system_schema_always_skipped(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
+    def test_system_schema_always_skipped(self, extractor_ctx):
+        extractor, client = extractor_ctx
 
-        sys_schema = MagicMock()
-        sys_schema.name = "information_schema"
-        sys_schema.comment = None
-        sys_schema.owner = None
+        sys_schema = _make_schema("information_schema")
         client.schemas.list.return_value = [sys_schema]
 
         catalog = extractor.extract_catalog("mycat")
         assert catalog.schemas == []
 
-    def test_columns_sorted_by_position(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+    def test_columns_sorted_by_position(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
         col_a = _make_col("a", position=2, type_text="STRING")
         col_b = _make_col("b", position=1, type_text="BIGINT")
@@ -148,21 +137,10 @@ class TestCatalogExtractor:
         cols = catalog.schemas[0].tables[0].columns
         assert [c.name for c in cols] == ["b", "a", "c"]
 
-    def test_pk_constraint(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
+    def test_pk_constraint(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
-
-        pk_c = MagicMock()
-        pk_c.name = "pk_orders"
-        pk_c.child_columns = ["order_id"]
+        pk_c = SimpleNamespace(name="pk_orders", child_columns=["order_id"])
         constraint = _make_constraint(pk=pk_c)
 
         sdk_table = _make_sdk_table("orders", constraints=[constraint])
@@ -174,23 +152,15 @@ class TestCatalogExtractor:
         assert table.primary_key.name == "pk_orders"
         assert table.primary_key.columns == ["order_id"]
 
-    def test_fk_constraint(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
+    def test_fk_constraint(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
-
-        fk_c = MagicMock()
-        fk_c.name = "fk_user"
-        fk_c.child_columns = ["user_id"]
-        fk_c.parent_table = "prod.users.accounts"
-        fk_c.parent_columns = ["id"]
+        fk_c = SimpleNamespace(
+            name="fk_user",
+            child_columns=["user_id"],
+            parent_table="prod.users.accounts",
+            parent_columns=["id"],
+        )
         constraint = _make_constraint(fk=fk_c)
 
         sdk_table = _make_sdk_table("orders", constraints=[constraint])
@@ -205,17 +175,8 @@ class TestCatalogExtractor:
         assert fk.ref_columns == ["id"]
         assert fk.columns == ["user_id"]
 
-    def test_owner_extracted_with_metadata(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+    def test_owner_extracted_with_metadata(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
         sdk_table = _make_sdk_table("t", owner="alice")
         client.tables.list.return_value = [sdk_table]
@@ -224,17 +185,8 @@ class TestCatalogExtractor:
         table = catalog.schemas[0].tables[0]
         assert table.owner == "alice"
 
-    def test_owner_excluded_without_metadata(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+    def test_owner_excluded_without_metadata(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
         sdk_table = _make_sdk_table("t", owner="alice")
         client.tables.list.return_value = [sdk_table]
@@ -243,125 +195,63 @@ class TestCatalogExtractor:
         table = catalog.schemas[0].tables[0]
         assert table.owner is None
 
-    def test_schema_owner_extracted(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
+    def test_schema_owner_extracted(self, extractor_ctx):
+        extractor, client = extractor_ctx
 
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = "data_team"
+        s = _make_schema("main", owner="data_team")
         client.schemas.list.return_value = [s]
-        client.tables.list.return_value = []
 
         catalog = extractor.extract_catalog("mycat", include_metadata=True)
         assert catalog.schemas[0].owner == "data_team"
 
-    def test_table_type_extracted(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
+    def test_table_type_extracted(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
-
-        sdk_table = _make_sdk_table("t", table_type_val="EXTERNAL")
+        sdk_table = _make_sdk_table("t", table_type=TableType.EXTERNAL)
         client.tables.list.return_value = [sdk_table]
 
         catalog = extractor.extract_catalog("mycat")
         assert catalog.schemas[0].tables[0].table_type == TableType.EXTERNAL
 
-    def test_schema_tags_extracted(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
+    def test_schema_tags_extracted(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
-        client.tables.list.return_value = []
-
-        def mock_list(entity_type, entity_name):
-            if entity_type == "schemas" and entity_name == "mycat.main":
-                return [_make_tag("env", "prod"), _make_tag("team", "data")]
-            return []
-
-        client.entity_tag_assignments.list.side_effect = mock_list
+        client.entity_tag_assignments.list.side_effect = _tag_dispatcher(
+            {("schemas", "mycat.main"): [_make_tag("env", "prod"), _make_tag("team", "data")]}
+        )
 
         catalog = extractor.extract_catalog("mycat", include_tags=True)
         assert catalog.schemas[0].tags == {"env": "prod", "team": "data"}
 
-    def test_table_tags_extracted(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+    def test_table_tags_extracted(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
         sdk_table = _make_sdk_table("orders")
         client.tables.list.return_value = [sdk_table]
 
-        def mock_list(entity_type, entity_name):
-            if entity_type == "tables" and entity_name == "mycat.main.orders":
-                return [_make_tag("pii", "true")]
-            return []
-
-        client.entity_tag_assignments.list.side_effect = mock_list
+        client.entity_tag_assignments.list.side_effect = _tag_dispatcher(
+            {("tables", "mycat.main.orders"): [_make_tag("pii", "true")]}
+        )
 
         catalog = extractor.extract_catalog("mycat", include_tags=True)
         assert catalog.schemas[0].tables[0].tags == {"pii": "true"}
 
-    def test_column_tags_extracted(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+    def test_column_tags_extracted(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
         col = _make_col("order_id", position=1, type_text="BIGINT")
         sdk_table = _make_sdk_table("orders", columns=[col])
         client.tables.list.return_value = [sdk_table]
 
-        def mock_list(entity_type, entity_name):
-            if entity_type == "columns" and entity_name == "mycat.main.orders.order_id":
-                return [_make_tag("sensitivity", "high")]
-            return []
-
-        client.entity_tag_assignments.list.side_effect = mock_list
+        client.entity_tag_assignments.list.side_effect = _tag_dispatcher(
+            {("columns", "mycat.main.orders.order_id"): [_make_tag("sensitivity", "high")]}
+        )
 
         catalog = extractor.extract_catalog("mycat", include_tags=True)
         assert catalog.schemas[0].tables[0].columns[0].tags == {"sensitivity": "high"}
 
-    def test_fetch_tags_not_found_logs_warning_and_continues(self, caplog):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+    def test_fetch_tags_not_found_logs_warning_and_continues(self, main_schema_ctx, caplog):
+        extractor, client = main_schema_ctx
 
         col = _make_col("order_id", position=1, type_text="BIGINT")
         sdk_table = _make_sdk_table("orders", columns=[col])
@@ -373,19 +263,10 @@ class TestCatalogExtractor:
             catalog = extractor.extract_catalog("mycat", include_tags=True)
 
         assert catalog.schemas[0].tables[0].columns[0].tags == {}
-        assert any("Not found" in r.message for r in caplog.records)
-
-    def test_tags_excluded_by_default(self):
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+        assert "Not found" in caplog.text
+
+    def test_tags_excluded_by_default(self, main_schema_ctx):
+        extractor, client = main_schema_ctx
 
         col = _make_col("id", position=1, type_text="BIGINT")
         sdk_table = _make_sdk_table("orders", columns=[col])
@@ -399,18 +280,9 @@ class TestCatalogExtractor:
         assert catalog.schemas[0].tables[0].tags == {}
         assert catalog.schemas[0].tables[0].columns[0].tags == {}
 
-    def test_tables_get_not_called(self):
+    def test_tables_get_not_called(self, main_schema_ctx):
         """tables.list results are used directly — tables.get should never be called."""
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+        extractor, client = main_schema_ctx
 
         sdk_table = _make_sdk_table("orders")
         client.tables.list.return_value = [sdk_table]
@@ -419,45 +291,26 @@ class TestCatalogExtractor:
 
         client.tables.get.assert_not_called()
 
-    def test_column_tags_slash_in_name(self):
+    def test_column_tags_slash_in_name(self, main_schema_ctx):
         """Column names containing slashes must be percent-encoded before tag lookup."""
-        extractor, client = self._extractor()
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+        extractor, client = main_schema_ctx
 
         col = _make_col("/example/column", position=1, type_text="STRING")
         sdk_table = _make_sdk_table("orders", columns=[col])
         client.tables.list.return_value = [sdk_table]
 
-        def mock_list(entity_type, entity_name):
-            if entity_type == "columns" and entity_name == "mycat.main.orders.%2Fexample%2Fcolumn":
-                return [_make_tag("sensitivity", "high")]
-            return []
-
-        client.entity_tag_assignments.list.side_effect = mock_list
+        encoded = "mycat.main.orders.%2Fexample%2Fcolumn"
+        client.entity_tag_assignments.list.side_effect = _tag_dispatcher(
+            {("columns", encoded): [_make_tag("sensitivity", "high")]}
+        )
 
         catalog = extractor.extract_catalog("mycat", include_tags=True)
         assert catalog.schemas[0].tables[0].columns[0].tags == {"sensitivity": "high"}
 
-    def test_parallel_extraction(self):
+    def test_parallel_extraction(self, main_schema_ctx):
         """With max_workers > 1, all tables are still extracted correctly."""
-        extractor, client = self._extractor(max_workers=4)
-        sdk_catalog = MagicMock()
-        sdk_catalog.comment = None
-        client.catalogs.get.return_value = sdk_catalog
-
-        s = MagicMock()
-        s.name = "main"
-        s.comment = None
-        s.owner = None
-        client.schemas.list.return_value = [s]
+        extractor, client = main_schema_ctx
+        extractor.max_workers = 4
 
         tables = [_make_sdk_table(f"t{i}") for i in range(5)]
         client.tables.list.return_value = tables
@@ -34,12 +34,11 @@ class TestColumn:
 
 
 class TestTableType:
-    def test_enum_values(self):
-        assert TableType.MANAGED.value == "MANAGED"
-        assert TableType.EXTERNAL.value == "EXTERNAL"
-        assert TableType.VIEW.value == "VIEW"
-        assert TableType.MATERIALIZED_VIEW.value == "MATERIALIZED_VIEW"
-        assert TableType.STREAMING_TABLE.value == "STREAMING_TABLE"
+    @pytest.mark.parametrize(
+        "name", ["MANAGED", "EXTERNAL", "VIEW", "MATERIALIZED_VIEW", "STREAMING_TABLE"]
+    )
+    def test_enum_values(self, name):
+        assert TableType[name].value == name
 
     def test_from_string(self):
         assert TableType("VIEW") is TableType.VIEW
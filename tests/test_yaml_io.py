@@ -1,5 +1,6 @@
 import json
 
+import pytest
 import yaml
 
 from databricks_schema.models import (
@@ -19,7 +20,9 @@ from databricks_schema.yaml_io import (
     schema_from_json,
     schema_from_yaml,
     schema_to_json,
+    schema_to_json_bytes,
     schema_to_yaml,
+    schema_to_yaml_bytes,
 )
 
 
@@ -68,6 +71,15 @@ class TestSchemaYamlRoundTrip:
         assert id_col.name == "id"
         assert id_col.nullable is False
 
+    def test_from_bytes(self):
+        original = _make_catalog().schemas[0]
+        restored = schema_from_yaml(schema_to_yaml(original).encode("utf-8"))
+        assert restored == original
+
+    def test_to_bytes_matches_text(self):
+        schema = Schema(name="s", comment="Zürich")
+        assert schema_to_yaml_bytes(schema) == schema_to_yaml(schema).encode("utf-8")
+
     def test_none_fields_absent_from_yaml(self):
         schema = Schema(name="empty")
         text = schema_to_yaml(schema)
@@ -92,6 +104,33 @@ class TestSchemaYamlRoundTrip:
         data = yaml.safe_load(text)
         assert "foreign_keys" not in data["tables"][0]
 
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="pins the libyaml emitter's folding")
+    def test_long_quoted_comment_folding(self):
+        comment = (
+            "This is a fairly long comment that contains\ta tab character and keeps going"
+            " well past the eighty column limit\nand a newline too"
+        )
+        text = schema_to_yaml(Schema(name="s", comment=comment))
+        assert text == (
+            "name: s\n"
+            'comment: "This is a fairly long comment that contains\\ta tab character'
+            " and keeps going\n"
+            '  well past the eighty column limit\\nand a newline too"\n'
+        )
+        assert schema_from_yaml(text).comment == comment
+
+    def test_empty_string_and_false_kept(self):
+        col = Column(name="c", data_type="STRING", nullable=False, comment="", tags={"k": ""})
+        schema = Schema(name="s", tables=[Table(name="t", columns=[col])])
+        data = yaml.safe_load(schema_to_yaml(schema))
+        assert data["tables"][0]["columns"][0] == {
+            "name": "c",
+            "data_type": "STRING",
+            "comment": "",
+            "nullable": False,
+            "tags": {"k": ""},
+        }
+
 
 class TestCatalogYamlRoundTrip:
     def test_round_trip(self):
@@ -149,6 +188,20 @@ class TestSchemaJsonRoundTrip:
         assert id_col.name == "id"
         assert id_col.nullable is False
 
+    def test_from_bytes(self):
+        original = _make_catalog().schemas[0]
+        restored = schema_from_json(schema_to_json(original).encode("utf-8"))
+        assert restored == original
+
+    def test_to_bytes_matches_json_dumps(self):
+        schema = Schema(name="s", comment="Zürich")
+        expected = json.dumps({"name": "s", "comment": "Zürich"}, indent=2, ensure_ascii=False)
+        assert schema_to_json_bytes(schema) == expected.encode("utf-8")
+
+    def test_nested_output_matches_json_dumps(self):
+        text = schema_to_json(_make_catalog().schemas[0])
+        assert text == json.dumps(json.loads(text), indent=2, ensure_ascii=False)
+
     def test_none_fields_absent_from_json(self):
         schema = Schema(name="empty")
         text = schema_to_json(schema)